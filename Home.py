@@ -3,7 +3,7 @@ import pandas as pd
 import numpy as np
 import asyncio
 from config.settings import Config 
-from utils import get_weather_data_nyc, get_air_quality_data_nyc, get_news_headlines, get_nyc_demographics
+from utils import prefetch_dashboard, get_nyc_demographics
 
 # 1. Define NYC Subregions and Coordinates 📍
 NYC_REGIONS = {
@@ -87,8 +87,11 @@ latitude = coords['latitude']
 longitude = coords['longitude']
 
 
+# --- Fetch weather, air quality and news concurrently ---
+dashboard_data = prefetch_dashboard(region=selected_region, latitude=latitude, longitude=longitude)
+
 # --- Fetch Weather Data ---
-weather_data = get_weather_data_nyc(latitude=latitude, longitude=longitude)
+weather_data = dashboard_data['weather']
 if weather_data is None:
     st.error("Could not fetch weather data.")
     st.stop()
@@ -105,7 +108,7 @@ current_status = current['status']
 status_icon = "https://cdn-icons-png.flaticon.com/128/869/869869.png" if current_status == "Clear" else "https://cdn-icons-png.flaticon.com/128/3353/3353748.png"
 
 # --- Fetch Air Quality Data ---
-aqi_data = get_air_quality_data_nyc(latitude=latitude, longitude=longitude)
+aqi_data = dashboard_data['air_quality']
 if aqi_data is None:
     current_aqi_value, current_aqi_category, dominant_pollutant, pm25_value, pm10_value = "N/A", "Unavailable", "N/A", "N/A", "N/A"
 else:
@@ -267,7 +270,7 @@ st.subheader(f"📰 Latest Headlines in {selected_region}")
 # 1. Fetch news data
 news_headlines = None
 try:
-    headlines_list = get_news_headlines(region=selected_region)
+    headlines_list = dashboard_data['news']
     if isinstance(headlines_list, str):
         # Split if returned as a single string
         headlines_list = [h.strip() for h in headlines_list.split("•") if h.strip()]
@@ -401,11 +404,12 @@ with col1:
     """, unsafe_allow_html=True)
 
 # Daily Max Temperature Card
+max_temp_today = "N/A"
 if not daily_df.empty and 'Today' in daily_df['Date'].values:
-    # Use .iloc[0] to get the value from the filtered Series
-    max_temp_today = daily_df.loc[daily_df['Date'] == 'Today', 'Max Temp'].iloc[0]
-else:
-    max_temp_today = "N/A"
+    # Use .iloc[0] to get the value from the filtered Series; a missing reading stays "N/A"
+    max_temp_value = daily_df.loc[daily_df['Date'] == 'Today', 'Max Temp'].iloc[0]
+    if pd.notna(max_temp_value):
+        max_temp_today = f"{max_temp_value:.1f}{daily_df.attrs.get('units', {}).get('Max Temp', '')}"
     
 with col2:
     st.markdown(f"""
@@ -445,4 +449,10 @@ if time_col:
 # --- Forecast Table ---
 st.markdown("---")
 st.subheader("7-Day Forecast")
-st.table(daily_df.rename(columns={'Max UV Index': 'Max UV'}))
\ No newline at end of file
+daily_units = daily_df.attrs.get('units', {})
+st.table(
+    daily_df.rename(columns={'Max UV Index': 'Max UV'}).style.format(
+        {**{col: f"{{:.1f}}{unit}" for col, unit in daily_units.items()}, 'Max UV': "{:.2f}"},
+        na_rep="N/A"
+    )
+)
\ No newline at end of file
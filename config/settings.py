@@ -1,4 +1,5 @@
 import os
+import numpy as np
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -44,6 +45,14 @@ class Config:
         return (cls.NYC_BOUNDS['south'] <= lat <= cls.NYC_BOUNDS['north'] and
                 cls.NYC_BOUNDS['west'] <= lng <= cls.NYC_BOUNDS['east'])
     
+    @classmethod
+    def points_in_nyc_bounds(cls, latlng):
+        """Check an (N, 2) array of (lat, lng) points against NYC boundaries; returns a boolean mask"""
+        latlng = np.asarray(latlng, dtype=np.float64).reshape(-1, 2)
+        lat, lng = latlng[:, 0], latlng[:, 1]
+        return ((lat >= cls.NYC_BOUNDS['south']) & (lat <= cls.NYC_BOUNDS['north']) &
+                (lng >= cls.NYC_BOUNDS['west']) & (lng <= cls.NYC_BOUNDS['east']))
+    
     @classmethod
     def get_nyc_bounds_string(cls):
         """Get NYC bounds as a formatted string for API calls"""
@@ -0,0 +1,17 @@
+import googlemaps
+import requests
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from config.settings import Config
+
+@lru_cache(maxsize=1)
+def get_maps_client() -> googlemaps.Client:
+    """
+    Google Maps client shared by every Maps wrapper
+
+    All Places/Geocoding/Directions calls go through one keep-alive
+    session, so back-to-back requests reuse the same TLS connection.
+    """
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=8))
+    return googlemaps.Client(key=Config.GOOGLE_MAPS_API_KEY, requests_session=session)
@@ -1,15 +1,17 @@
-import googlemaps
+import numpy as np
 import streamlit as st
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple
 from config.settings import Config
+from src.maps.client import get_maps_client
+from src.maps.polyline_numba import decode_polyline
 
 class DirectionsAPI:
     """Google Directions API integration for route calculation with traffic"""
     
     def __init__(self):
         """Initialize the Directions API client"""
-        self.client = googlemaps.Client(key=Config.GOOGLE_MAPS_API_KEY)
+        self.client = get_maps_client()
     
     def get_routes(self, start_address: str, end_address: str, 
                    departure_time: Optional[datetime] = None) -> Optional[Dict]:
@@ -92,6 +94,11 @@ class DirectionsAPI:
                 'end_address': leg['end_address'],
                 'start_location': leg['start_location'],
                 'end_location': leg['end_location'],
+                # (2, 2) array of start/end (lat, lng) for cheap center math at render time
+                'endpoints': np.array([
+                    [leg['start_location']['lat'], leg['start_location']['lng']],
+                    [leg['end_location']['lat'], leg['end_location']['lng']]
+                ], dtype=np.float64),
                 'steps': self._extract_steps(leg['steps']),
                 'polyline': route['overview_polyline']['points'],
                 'warnings': route.get('warnings', []),
@@ -207,7 +214,7 @@ class DirectionsAPI:
             List of (lat, lng) coordinate tuples
         """
         try:
-            return googlemaps.convert.decode_polyline(polyline_string)
+            return [tuple(point) for point in decode_polyline(polyline_string).tolist()]
         except Exception as e:
             st.error(f"Polyline decoding error: {str(e)}")
             return []
\ No newline at end of file
@@ -1,14 +1,14 @@
-import googlemaps
 import streamlit as st
 from typing import List, Dict, Optional
 from config.settings import Config
+from src.maps.client import get_maps_client
 
 class PlacesAPI:
     """Google Places API integration for address autocomplete and validation"""
     
     def __init__(self):
         """Initialize the Places API client"""
-        self.client = googlemaps.Client(key=Config.GOOGLE_MAPS_API_KEY)
+        self.client = get_maps_client()
     
     @st.cache_data(ttl=Config.CACHE_DURATION)
     def autocomplete(_self, input_text: str, location_bias: Optional[Dict] = None) -> List[Dict]:
@@ -74,7 +74,8 @@ class PlacesAPI:
             st.error(f"Place details error: {str(e)}")
             return None
     
-    def geocode_address(self, address: str) -> Optional[Dict]:
+    @st.cache_data(ttl=Config.CACHE_DURATION)
+    def geocode_address(_self, address: str) -> Optional[Dict]:
         """
         Geocode an address to get coordinates
         
@@ -85,7 +86,7 @@ class PlacesAPI:
             Geocoding result or None if error
         """
         try:
-            results = self.client.geocode(
+            results = _self.client.geocode(
                 address=address,
                 components={'country': 'US', 'administrative_area': 'NY'}
             )
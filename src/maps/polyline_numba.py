@@ -0,0 +1,63 @@
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def decode_polyline_njit(buf: np.ndarray) -> np.ndarray:
+    """
+    Decode a Google Encoded Polyline held as a uint8 byte array
+
+    Args:
+        buf: ASCII bytes of the encoded polyline
+
+    Returns:
+        (N, 2) float64 array of (lat, lng) pairs
+    """
+    n = buf.shape[0]
+    # Every value takes at least one byte, so a point takes at least two
+    coords = np.empty((n // 2 + 1, 2), dtype=np.float64)
+
+    index = 0
+    count = 0
+    lat = 0
+    lng = 0
+
+    while index < n:
+        for axis in range(2):
+            result = 0
+            shift = 0
+            while True:
+                if index >= n:
+                    raise ValueError("Truncated polyline")
+                b = np.int64(buf[index]) - 63
+                index += 1
+                result |= (b & 0x1f) << shift
+                shift += 5
+                if b < 0x20:
+                    break
+
+            delta = ~(result >> 1) if result & 1 else (result >> 1)
+            if axis == 0:
+                lat += delta
+            else:
+                lng += delta
+
+        coords[count, 0] = lat * 1e-5
+        coords[count, 1] = lng * 1e-5
+        count += 1
+
+    return coords[:count]
+
+
+def decode_polyline(polyline: str) -> np.ndarray:
+    """
+    Decode polyline string to an (N, 2) array of (lat, lng) coordinates
+
+    Args:
+        polyline: Encoded polyline from Google Directions
+
+    Returns:
+        (N, 2) float64 array of (lat, lng) pairs
+    """
+    buf = np.frombuffer(polyline.encode('ascii'), dtype=np.uint8)
+    return decode_polyline_njit(buf)
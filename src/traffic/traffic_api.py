@@ -1,5 +1,6 @@
-import requests
+import orjson
 import streamlit as st
+from src.utils.http import get_session
 
 class NYTrafficAPI:
     """Fetch live NYC traffic data from 511NY API"""
@@ -17,9 +18,9 @@ class NYTrafficAPI:
             "type": event_type
         }
         try:
-            response = requests.get(NYTrafficAPI.BASE_URL, params=params, timeout=15)
+            response = get_session().get(NYTrafficAPI.BASE_URL, params=params, timeout=15)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
         except Exception as e:
             st.error(f"Unable to fetch 511NY data: {e}")
             return []
@@ -4,13 +4,33 @@ from src.maps.places_api import PlacesAPI
 from src.utils.validation import AddressValidator, InputSanitizer
 from src.utils.helpers import UIHelpers, RouteDisplayUtils, DataUtils
 
+@st.cache_resource
+def _places_api() -> PlacesAPI:
+    """Shared Places API client, reused across reruns and sessions"""
+    return PlacesAPI()
+
+@st.cache_resource
+def _validator() -> AddressValidator:
+    """Shared address validator"""
+    return AddressValidator()
+
+@st.cache_resource
+def _sanitizer() -> InputSanitizer:
+    """Shared input sanitizer"""
+    return InputSanitizer()
+
+@st.cache_data(max_entries=1024)
+def _sanitize(address: str) -> str:
+    """Sanitize an address once per unique raw input"""
+    return _sanitizer().sanitize_address(address)
+
 class AddressInput:
     """Address input component with autocomplete functionality"""
     
     def __init__(self):
-        self.places_api = PlacesAPI()
-        self.validator = AddressValidator()
-        self.sanitizer = InputSanitizer()
+        self.places_api = _places_api()
+        self.validator = _validator()
+        self.sanitizer = _sanitizer()
     
     def render_address_input(self, label: str, key: str, placeholder: str = "") -> Tuple[str, bool]:
         """
@@ -36,7 +56,7 @@ class AddressInput:
             return "", False
         
         # Sanitize input
-        sanitized_address = self.sanitizer.sanitize_address(address)
+        sanitized_address = _sanitize(address)
         
         # Show autocomplete suggestions if address is being typed
         if len(sanitized_address) >= 3:
@@ -72,7 +92,7 @@ class AddressInput:
                             key=f"{key}_suggestion_{suggestion['place_id']}"
                         ):
                             st.session_state[key] = suggestion['description']
-                            st.experimental_rerun()
+                            st.rerun()
         except Exception:
             pass  # Silently handle autocomplete errors
 
@@ -245,28 +265,38 @@ class SearchControls:
 class LoadingIndicator:
     """Loading indicator component"""
     
+    ROUTE_CALCULATION_STEPS = [
+        "Validating addresses...",
+        "Fetching route options...",
+        "Analyzing traffic conditions...",
+        "Calculating efficiency scores...",
+        "Preparing results..."
+    ]
+    
     @staticmethod
     def show_route_calculation():
-        """Show loading indicator for route calculation"""
+        """
+        Show loading indicator for route calculation
+        
+        Generator driven by the caller: call next() each time a real
+        pipeline stage starts, and the progress bar advances accordingly.
+        
+        Yields:
+            The label of the stage being started
+        """
         with st.spinner("🗺️ Calculating optimal routes with real-time traffic data..."):
             progress_bar = st.progress(0)
+            step_text = st.empty()
+            steps = LoadingIndicator.ROUTE_CALCULATION_STEPS
             
-            # Simulate progress steps
-            import time
-            steps = [
-                "Validating addresses...",
-                "Fetching route options...",
-                "Analyzing traffic conditions...",
-                "Calculating efficiency scores...",
-                "Preparing results..."
-            ]
-            
-            for i, step in enumerate(steps):
-                st.text(step)
-                progress_bar.progress((i + 1) / len(steps))
-                time.sleep(0.5)  # Small delay for visual effect
-            
-            progress_bar.empty()
+            try:
+                for i, step in enumerate(steps):
+                    step_text.text(step)
+                    progress_bar.progress(i / len(steps))
+                    yield step
+            finally:
+                progress_bar.empty()
+                step_text.empty()
 
 class ErrorDisplay:
     """Error display component"""
@@ -306,18 +336,30 @@ class SearchHistory:
         """Add search to history"""
         if 'search_history' not in st.session_state:
             st.session_state.search_history = []
+        if 'search_history_keys' not in st.session_state:
+            st.session_state.search_history_keys = {
+                (entry['start'], entry['end']) for entry in st.session_state.search_history
+            }
+        
+        history = st.session_state.search_history
+        seen = st.session_state.search_history_keys
+        
+        # Avoid duplicates (same route regardless of timestamp)
+        search_key = (start_address, end_address)
+        if search_key in seen:
+            return
         
-        search_entry = {
+        seen.add(search_key)
+        history.insert(0, {
             'start': start_address,
             'end': end_address,
             'timestamp': st.session_state.get('last_search_time', 'Unknown')
-        }
+        })
         
-        # Avoid duplicates
-        if search_entry not in st.session_state.search_history:
-            st.session_state.search_history.insert(0, search_entry)
-            # Keep only last 10 searches
-            st.session_state.search_history = st.session_state.search_history[:10]
+        # Keep only last 10 searches
+        while len(history) > 10:
+            oldest = history.pop()
+            seen.discard((oldest['start'], oldest['end']))
     
     @staticmethod
     def render_search_history():
@@ -337,4 +379,4 @@ class SearchHistory:
                     if st.button(f"Repeat Search {i+1}", key=f"repeat_{i}"):
                         st.session_state['start_address'] = search['start']
                         st.session_state['end_address'] = search['end']
-                        st.experimental_rerun()
\ No newline at end of file
+                        st.rerun()
\ No newline at end of file
@@ -1,15 +1,60 @@
+import hashlib
+import json
 import streamlit as st
+import streamlit.components.v1 as components
 import folium
 from streamlit_folium import st_folium
 import googlemaps
-from typing import Dict, List, Tuple
+import numpy as np
+from typing import Dict, List, Optional, Tuple
 from config.settings import Config
+from src.maps.client import get_maps_client
+from src.maps.polyline_numba import decode_polyline
+
+# Polyline styles by route index: the best route is highlighted, alternatives muted
+_ROUTE_STYLES = (
+    {'color': 'blue', 'weight': 6, 'opacity': 0.8},
+) + ({'color': 'gray', 'weight': 4, 'opacity': 0.6},) * 4
+
+def _safe_float(value, default: float) -> Tuple[bool, float]:
+    """Return (ok, value) for a coordinate without raising; missing values use default"""
+    if value is None:
+        return True, default
+    if isinstance(value, (int, float)):
+        return True, float(value)
+    return False, default
+
+def _marker_coords(route: Dict) -> Optional[Tuple[List[float], List[float]]]:
+    """Start/end marker coordinates of a route, or None if any of them is invalid"""
+    start = route.get('start_location', {})
+    end = route.get('end_location', {})
+
+    start_lat_ok, start_lat = _safe_float(start.get('lat'), 40.7128)
+    start_lng_ok, start_lng = _safe_float(start.get('lng'), -74.0060)
+    end_lat_ok, end_lat = _safe_float(end.get('lat'), 40.7128)
+    end_lng_ok, end_lng = _safe_float(end.get('lng'), -74.0060)
+
+    if start_lat_ok and start_lng_ok and end_lat_ok and end_lng_ok:
+        return [start_lat, start_lng], [end_lat, end_lng]
+    return None
+
+def _warn_if_markers_invalid(routes: List[Dict]) -> None:
+    """Report (on every run, not just cache misses) that the route markers were skipped"""
+    if _marker_coords(routes[0]) is None:
+        st.warning("Could not add route markers due to invalid coordinates")
+
+@st.cache_data(ttl=Config.CACHE_DURATION)
+def _decode_polyline_cached(polyline: str) -> np.ndarray:
+    """Decode a polyline once per unique string (also amortizes JIT compilation)"""
+    return decode_polyline(polyline)
 
 class MapDisplay:
     """Interactive map display component using Folium"""
 
-    def __init__(self):
-        self.client = googlemaps.Client(key=Config.GOOGLE_MAPS_API_KEY)
+    @property
+    def client(self) -> googlemaps.Client:
+        """Google Maps client shared with the other Maps wrappers, created on first use"""
+        return get_maps_client()
 
     # ======================== TRAFFIC MAP ========================
     def render_traffic_overlay_map(self, center_location: Dict) -> None:
@@ -18,119 +63,181 @@ class MapDisplay:
             # Ensure coordinates are float values with safe defaults
             lat = float(center_location.get('lat', 40.7128))
             lng = float(center_location.get('lng', -74.0060))
-            
-            # Create base map with minimal parameters
-            m = folium.Map(
-                location=[lat, lng],
-                zoom_start=12,
-                tiles='OpenStreetMap'  # Use default tile layer
+
+            # Display-only map: emit the cached pre-rendered HTML directly
+            components.html(
+                self._build_traffic_map_html(lat, lng),
+                width=800,
+                height=400
             )
 
-            # Add traffic layer directly without dict
-            folium.TileLayer(
-                tiles='https://mt1.google.com/vt/lyrs=m,traffic&x={x}&y={y}&z={z}',
-                attr='Google Traffic',
-                name='Traffic',
-                overlay=True
-            ).add_to(m)
+        except Exception as e:
+            st.error(f"Traffic map error: {str(e)}")
+
+    @st.cache_data(ttl=Config.CACHE_DURATION, max_entries=64)
+    def _build_traffic_map_html(_self, lat: float, lng: float) -> str:
+        """Build the traffic map and render its HTML once per center"""
+        # Create base map with minimal parameters
+        m = folium.Map(
+            location=[lat, lng],
+            zoom_start=12,
+            tiles='OpenStreetMap'  # Use default tile layer
+        )
+
+        # Add traffic layer directly without dict
+        folium.TileLayer(
+            tiles='https://mt1.google.com/vt/lyrs=m,traffic&x={x}&y={y}&z={z}',
+            attr='Google Traffic',
+            name='Traffic',
+            overlay=True
+        ).add_to(m)
+
+        return m.get_root().render()
+
+    # ======================== ROUTE MAP ========================
+    def render_route_map(self, routes_data: Dict, interactive: bool = False) -> Optional[Dict]:
+        """
+        Render route map with simplified parameters
+
+        Args:
+            routes_data: Routes as returned by DirectionsAPI.get_routes
+            interactive: Use st_folium so clicks can be read back;
+                otherwise the cached map HTML is embedded as a static iframe
+
+        Returns:
+            In interactive mode, st_folium's result ({'last_object_clicked': ...});
+            None for the static map or when nothing was rendered
+        """
+        if not interactive:
+            self.render_route_map_static(routes_data)
+            return None
+
+        try:
+            routes = routes_data.get('routes', [])
+            if not routes:
+                return None
+
+            # Stable key keeps the mounted component across reruns; st_folium needs a
+            # fresh Map each run, since rendering mutates it
+            map_key = self._routes_key(routes_data)
+            m = self._build_route_map(routes)
+            _warn_if_markers_invalid(routes)
 
-            # Render map with minimal parameters
-            st_folium(
+            # Only the clicked object is sent back; the rest of the map state
+            # (bounds, zoom, ...) would trigger a rerun on every pan
+            return st_folium(
                 m,
                 width=800,
-                height=400,
-                key="traffic_map_static"
+                height=600,
+                key=f"route_map_{map_key}",
+                returned_objects=["last_object_clicked"]
             )
 
         except Exception as e:
-            st.error(f"Traffic map error: {str(e)}")
+            st.error(f"Route map error: {str(e)}")
+            return None
 
-    # ======================== ROUTE MAP ========================
-    def render_route_map(self, routes_data: Dict) -> None:
-        """Render route map with simplified parameters"""
+    def render_route_map_static(self, routes_data: Dict) -> None:
+        """Render route map as pre-rendered HTML in an iframe, bypassing st_folium"""
         try:
             routes = routes_data.get('routes', [])
             if not routes:
                 return
 
-            # Extract and validate center coordinates
-            first_route = routes[0]
-            start_loc = first_route.get('start_location', {})
-            end_loc = first_route.get('end_location', {})
-            
-            center_lat = (float(start_loc.get('lat', 40.7128)) + float(end_loc.get('lat', 40.7128))) / 2
-            center_lng = (float(start_loc.get('lng', -74.0060)) + float(end_loc.get('lng', -74.0060))) / 2
+            components.html(
+                self._build_route_map_html(self._routes_key(routes_data), routes),
+                width=800,
+                height=600
+            )
+            _warn_if_markers_invalid(routes)
+
+        except Exception as e:
+            st.error(f"Route map error: {str(e)}")
+
+    @staticmethod
+    def _routes_key(routes_data: Dict) -> str:
+        """Short digest identifying a routes_data payload"""
+        return hashlib.blake2b(
+            json.dumps(routes_data, sort_keys=True, default=str).encode(),
+            digest_size=8
+        ).hexdigest()
+
+    @st.cache_data(ttl=Config.CACHE_DURATION, max_entries=64)
+    def _build_route_map_html(_self, map_key: str, _routes: List[Dict]) -> str:
+        """Render the route map's HTML once per unique routes_data (keyed by map_key)"""
+        return _self._build_route_map(_routes).get_root().render()
+
+    def _build_route_map(self, routes: List[Dict]) -> folium.Map:
+        """Build a new route map: every route's polyline plus start/end markers"""
+        # Decode every route once; the viewport is fitted to all of them
+        decoded_routes = [
+            self._safe_decode_polyline(route.get('polyline', '')) for route in routes[:5]
+        ]
+        route_coords = [coords for coords in decoded_routes if len(coords)]
+
+        if route_coords:
+            # Let Leaflet pick center + zoom from the bounds of all routes
+            all_coords = np.vstack(route_coords)
+            m = folium.Map(tiles='OpenStreetMap')
+            m.fit_bounds(
+                [all_coords.min(axis=0).tolist(), all_coords.max(axis=0).tolist()],
+                padding=(20, 20)
+            )
+        else:
+            # Fall back to the midpoint of the first route's endpoints
+            endpoints = routes[0].get('endpoints')
+            if endpoints is None:
+                endpoints = np.array([[40.7128, -74.0060], [40.7128, -74.0060]])
             
-            # Create base map with validated coordinates
             m = folium.Map(
-                location=[center_lat, center_lng],
+                location=((endpoints[0] + endpoints[1]) * 0.5).tolist(),
                 zoom_start=12,
                 tiles='OpenStreetMap'
             )
 
-            # Add routes with basic styling
-            for i, route in enumerate(routes[:5]):
-                coords = self._safe_decode_polyline(route.get('polyline', ''))
-                if coords:
-                    # Ensure coordinates are float values
-                    try:
-                        coords = [[float(lat), float(lng)] for lat, lng in coords]
-                        folium.PolyLine(
-                            locations=coords,
-                            color='blue' if i == 0 else 'gray',
-                            weight=6 if i == 0 else 4,
-                            opacity=0.8 if i == 0 else 0.6,
-                            tooltip=f"Route {i+1}"
-                        ).add_to(m)
-                    except (ValueError, TypeError):
-                        continue
-
-            # Add markers with validated coordinates
-            if routes:
-                start = routes[0].get('start_location', {})
-                end = routes[0].get('end_location', {})
-                
-                try:
-                    folium.Marker(
-                        [float(start.get('lat', 40.7128)), float(start.get('lng', -74.0060))],
-                        popup='Start',
-                        icon=folium.Icon(color='green')
-                    ).add_to(m)
-                    
-                    folium.Marker(
-                        [float(end.get('lat', 40.7128)), float(end.get('lng', -74.0060))],
-                        popup='End',
-                        icon=folium.Icon(color='red')
-                    ).add_to(m)
-                except (ValueError, TypeError):
-                    st.warning("Could not add route markers due to invalid coordinates")
-
-            # Render map with minimal parameters
-            st_folium(
-                m,
-                width=800,
-                height=600,
-                key="route_map_static"
-            )
+        # Collect all route layers in one group, attached to the map once
+        routes_layer = folium.FeatureGroup(name='routes')
 
-        except Exception as e:
-            st.error(f"Route map error: {str(e)}")
+        # Add routes with basic styling
+        for i, coords in enumerate(decoded_routes):
+            # Decoded coordinates are already float64; one vectorized finiteness check suffices
+            if len(coords) and np.isfinite(coords).all():
+                folium.PolyLine(
+                    # Polylines carry 1e-5 precision; rounding keeps float noise out of the HTML
+                    locations=np.round(coords, 5).tolist(),
+                    tooltip=f"Route {i+1}",
+                    **_ROUTE_STYLES[i]
+                ).add_to(routes_layer)
+
+        # Add markers with validated coordinates (render_* warns when they are skipped)
+        markers = _marker_coords(routes[0])
+        if markers is not None:
+            start, end = markers
+            folium.Marker(
+                start,
+                popup='Start',
+                icon=folium.Icon(color='green')
+            ).add_to(routes_layer)
+            
+            folium.Marker(
+                end,
+                popup='End',
+                icon=folium.Icon(color='red')
+            ).add_to(routes_layer)
+
+        routes_layer.add_to(m)
+
+        return m
 
-    def _calculate_map_center(self, route: Dict) -> Dict:
-        """Calculate map center from route endpoints"""
-        start = route.get('start_location', {'lat': 40.7128, 'lng': -74.0060})
-        end = route.get('end_location', {'lat': 40.7128, 'lng': -74.0060})
-        return {
-            'lat': (start['lat'] + end['lat']) / 2,
-            'lng': (start['lng'] + end['lng']) / 2
-        }
-
-    def _safe_decode_polyline(self, polyline: str) -> List[Tuple[float, float]]:
-        """Safely decode polyline to coordinates"""
+    def _safe_decode_polyline(self, polyline: str) -> np.ndarray:
+        """Safely decode polyline to an (N, 2) array of coordinates"""
+        if not polyline:
+            return np.empty((0, 2))
         try:
-            return googlemaps.convert.decode_polyline(polyline)
-        except:
-            return []
+            return _decode_polyline_cached(polyline)
+        except (ValueError, TypeError):
+            # Truncated or non-ASCII polyline
+            return np.empty((0, 2))
 
     def _add_markers(self, m: folium.Map, route: Dict) -> None:
         """Add start/end markers to map"""
@@ -1,12 +1,18 @@
 import streamlit as st
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, List, Any
+import numpy as np
 import pandas as pd
 
+# Route display colors, cycled by route index
+_ROUTE_COLORS = ('#FF0000', '#0000FF', '#00FF00', '#FF8C00', '#8A2BE2')
+
 class TimeUtils:
     """Time-related utility functions"""
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def seconds_to_readable(seconds: int) -> str:
         """Convert seconds to human-readable format"""
         if seconds < 60:
@@ -41,6 +47,7 @@ class DistanceUtils:
     """Distance-related utility functions"""
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def meters_to_readable(meters: int) -> str:
         """Convert meters to human-readable format"""
         if meters < 1000:
@@ -58,25 +65,20 @@ class RouteDisplayUtils:
     @staticmethod
     def create_route_comparison_df(routes: List[Dict]) -> pd.DataFrame:
         """Create a DataFrame for route comparison"""
-        data = []
-        
-        for i, route in enumerate(routes):
-            data.append({
-                'Route': f"Route {i+1}: {route['summary']}",
-                'Distance': route['distance']['text'],
-                'Normal Time': route['duration']['text'],
-                'With Traffic': route['duration_in_traffic']['text'],
-                'Traffic Delay': f"{route['traffic_delay']['delay_minutes']} min",
-                'Efficiency Score': f"{route['efficiency_score']}/100"
-            })
-        
-        return pd.DataFrame(data)
+        # Build column-wise so pandas gets one homogeneous list per column
+        return pd.DataFrame({
+            'Route': [f"Route {i+1}: {route['summary']}" for i, route in enumerate(routes)],
+            'Distance': [route['distance']['text'] for route in routes],
+            'Normal Time': [route['duration']['text'] for route in routes],
+            'With Traffic': [route['duration_in_traffic']['text'] for route in routes],
+            'Traffic Delay': [f"{route['traffic_delay']['delay_minutes']} min" for route in routes],
+            'Efficiency Score': [f"{route['efficiency_score']}/100" for route in routes]
+        })
     
     @staticmethod
     def get_route_color(route_index: int) -> str:
         """Get color for route display based on index"""
-        colors = ['#FF0000', '#0000FF', '#00FF00', '#FF8C00', '#8A2BE2']
-        return colors[route_index % len(colors)]
+        return _ROUTE_COLORS[route_index % 5]
     
     @staticmethod
     def format_traffic_status(delay_percentage: float) -> tuple:
@@ -187,8 +189,13 @@ class DataUtils:
         if len(routes) < 2:
             return {}
         
-        fastest_time = min(route['duration_in_traffic']['value'] for route in routes)
-        slowest_time = max(route['duration_in_traffic']['value'] for route in routes)
+        times = np.fromiter(
+            (route['duration_in_traffic']['value'] for route in routes),
+            dtype=np.int64,
+            count=len(routes)
+        )
+        fastest_time = int(times.min())
+        slowest_time = int(times.max())
         
         time_savings = slowest_time - fastest_time
         
@@ -0,0 +1,199 @@
+import atexit
+import os
+import sqlite3
+import threading
+import time
+import orjson
+import requests
+from cachetools import LRUCache
+from functools import lru_cache
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# (connect, read) timeout: fail fast on unreachable hosts, allow slower bodies
+DEFAULT_TIMEOUT = (3.05, 7)
+
+# Forecast payloads are cached on disk for this many seconds (see get_forecast_json)
+FORECAST_CACHE_TTL = 900
+_FORECAST_CACHE_PATH = os.path.join('.cache', 'forecast.sqlite')
+
+@lru_cache(maxsize=1)
+def get_session() -> requests.Session:
+    """
+    Process-wide keep-alive HTTP session
+
+    Every outbound REST call (Open-Meteo, Air Quality, NewsAPI, 511NY) goes
+    through this one connection pool, so repeat calls to a host skip DNS,
+    TCP and TLS setup. Transient failures (429/5xx, dropped connections)
+    are retried with exponential backoff. Closed at interpreter exit.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        connect=2,
+        read=2,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({'GET', 'POST'}),  # the only POST is a read-only lookup
+        raise_on_status=False  # hand the final response to raise_for_status()
+    )
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    atexit.register(session.close)
+    return session
+
+def read_capped(response: requests.Response, max_bytes: int) -> bytes:
+    """
+    Read a streamed (stream=True) response body, refusing bodies over max_bytes
+
+    A declared Content-Length is checked before anything is downloaded; bodies
+    without one are read in chunks and abandoned as soon as they pass the cap.
+
+    Raises:
+        ValueError: if the body is larger than max_bytes
+    """
+    declared = response.headers.get('Content-Length')
+    if declared is not None and declared.isdigit() and int(declared) > max_bytes:
+        raise ValueError(f"Response too large: {declared} bytes (limit {max_bytes})")
+
+    body = bytearray()
+    for chunk in response.iter_content(chunk_size=64 * 1024):
+        body += chunk
+        if len(body) > max_bytes:
+            raise ValueError(f"Response too large: over {max_bytes} bytes")
+    return bytes(body)
+
+class _DiskCache:
+    """Tiny SQLite key -> bytes store with per-entry expiry, shared across threads"""
+
+    def __init__(self, path: str):
+        """Open (creating if needed) the cache file; raises OSError/sqlite3.Error if it can't"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._db:
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, expires REAL, body BLOB)'
+            )
+            # Drop whatever expired while the app was down
+            self._db.execute('DELETE FROM entries WHERE expires <= ?', (time.time(),))
+        atexit.register(self._db.close)
+
+    # A cache failure (locked or unwritable file) only costs a download, so it is not raised
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            with self._lock:
+                row = self._db.execute(
+                    'SELECT body FROM entries WHERE key = ? AND expires > ?', (key, time.time())
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
+
+    def set(self, key: str, body: bytes, ttl: float) -> None:
+        try:
+            now = time.time()
+            with self._lock, self._db:
+                # Purge expired entries on every write so the file stays bounded
+                self._db.execute('DELETE FROM entries WHERE expires <= ?', (now,))
+                self._db.execute(
+                    'INSERT OR REPLACE INTO entries VALUES (?, ?, ?)', (key, now + ttl, body)
+                )
+        except sqlite3.Error:
+            pass
+
+@lru_cache(maxsize=1)
+def _forecast_cache() -> Optional[_DiskCache]:
+    """The forecast disk cache, or None (no disk caching) if the file can't be opened"""
+    try:
+        return _DiskCache(_FORECAST_CACHE_PATH)
+    except (OSError, sqlite3.Error) as e:
+        print(f"Forecast disk cache unavailable, continuing without it: {e}")
+        return None
+
+def get_forecast_json(
+    url: str,
+    params: Dict[str, Any],
+    max_bytes: int,
+    timeout=DEFAULT_TIMEOUT,
+    cache_key: Optional[str] = None
+) -> Any:
+    """
+    GET a forecast JSON payload with a size cap, cached on disk
+
+    The body is streamed through the shared session and read with
+    read_capped(), so an oversized payload is abandoned mid-download and
+    never held in full. Only a complete, valid payload is stored; it is kept
+    in a SQLite file for FORECAST_CACHE_TTL seconds, so Streamlit restarts
+    reuse it instead of downloading it again. Entries are keyed on cache_key
+    when given (e.g. rounded coordinates), else on the URL and params. If the
+    cache file can't be used, every call simply downloads.
+
+    Raises:
+        requests.exceptions.RequestException: on network or HTTP errors
+        ValueError: if the body exceeds max_bytes
+        orjson.JSONDecodeError: if the body is not valid JSON
+    """
+    key = cache_key or f"{url}?{urlencode(sorted(params.items()))}"
+    cache = _forecast_cache()
+    body = cache.get(key) if cache is not None else None
+    if body is not None:
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            pass  # Corrupt entry: download again and overwrite it
+
+    with get_session().get(url, params=params, timeout=timeout, stream=True) as response:
+        response.raise_for_status()
+        body = read_capped(response, max_bytes)
+
+    data = orjson.loads(body)
+    if cache is not None:
+        cache.set(key, body, FORECAST_CACHE_TTL)
+    return data
+
+# Last validators (ETag / Last-Modified) and decoded body per GET request
+_CONDITIONAL_CACHE = LRUCache(maxsize=64)
+_CONDITIONAL_LOCK = threading.Lock()
+
+def get_json(url: str, params: Optional[Dict[str, Any]] = None, timeout=DEFAULT_TIMEOUT) -> Any:
+    """
+    GET a JSON endpoint through the shared session, revalidating conditionally
+
+    If the previous response for the same URL and params carried an ETag or
+    Last-Modified header, it is sent back as If-None-Match/If-Modified-Since;
+    a 304 reuses the previously decoded body without transferring it again.
+    Servers without validators simply get a normal GET.
+
+    Raises:
+        requests.exceptions.RequestException: on network or HTTP errors
+        orjson.JSONDecodeError: if the body is not valid JSON
+    """
+    key = (url, tuple(sorted((params or {}).items())))
+    with _CONDITIONAL_LOCK:
+        cached = _CONDITIONAL_CACHE.get(key)
+
+    headers = {}
+    if cached is not None:
+        validators, _ = cached
+        if validators.get('ETag'):
+            headers['If-None-Match'] = validators['ETag']
+        if validators.get('Last-Modified'):
+            headers['If-Modified-Since'] = validators['Last-Modified']
+
+    response = get_session().get(url, params=params, headers=headers, timeout=timeout)
+    if response.status_code == 304 and cached is not None:
+        return cached[1]
+
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+
+    validators = {name: response.headers[name] for name in ('ETag', 'Last-Modified') if name in response.headers}
+    if validators:
+        with _CONDITIONAL_LOCK:
+            _CONDITIONAL_CACHE[key] = (validators, data)
+    return data
@@ -1,9 +1,37 @@
 import re
 import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from typing import Optional, Tuple
 from config.settings import Config
 from src.maps.places_api import PlacesAPI
 
+# Precompiled sanitization patterns
+_WS_RE = re.compile(r'\s+')
+_HTML_RE = re.compile(r'<[^>]*>')
+_BAD_RE = re.compile(r'[<>"\']')
+
+# Well-formed address: 5-200 chars containing at least one digit and one letter
+_FMT_RE = re.compile(r'(?=.*\d)(?=.*[a-zA-Z]).{5,200}', re.DOTALL)
+
+# Trailing ZIP / ZIP+4, and the ZIP prefixes used in the five boroughs
+# (100-104, 110-114, 116; 115xx is Nassau County)
+_ZIP_TAIL_RE = re.compile(r'\b(\d{5})(?:-\d{4})?\s*$')
+_NYC_ZIP_RE = re.compile(r'1(?:0[0-4]|1[0-46])\d\d')
+
+# USPS state, district, territory and military codes
+_USPS_STATE_CODES = (
+    'AL AK AZ AR CA CO CT DE FL GA HI ID IL IN IA KS KY LA ME MD MA MI MN MS MO '
+    'MT NE NV NH NJ NM NY NC ND OH OK OR PA RI SC SD TN TX UT VT VA WA WV WI WY '
+    'DC PR VI GU AS MP AA AE AP'
+).split()
+
+# Trailing uppercase USPS state code, optionally followed by a ZIP (a country suffix
+# such as ", US" is not a state; case-sensitive so words like ", In" or "Me" are not codes)
+_STATE_TAIL_RE = re.compile(
+    r',\s*(' + '|'.join(_USPS_STATE_CODES) + r')\s*(?:\d{5}(?:-\d{4})?)?\s*$'
+)
+
 class AddressValidator:
     """Address validation utilities for NYC locations"""
     
@@ -25,20 +53,19 @@ class AddressValidator:
         
         address = address.strip()
         
+        # Fast path: one scan accepts well-formed addresses
+        if _FMT_RE.fullmatch(address):
+            return True, ""
+        
+        # Otherwise only determine which rule failed
         if len(address) < 5:
             return False, "Address is too short"
         
         if len(address) > 200:
             return False, "Address is too long"
         
-        # Check for basic address components
-        has_number = bool(re.search(r'\d', address))
-        has_letters = bool(re.search(r'[a-zA-Z]', address))
-        
-        if not (has_number and has_letters):
-            return False, "Address should contain both numbers and letters"
-        
-        return True, ""
+        # Missing basic address components
+        return False, "Address should contain both numbers and letters"
     
     def validate_nyc_address(self, address: str) -> Tuple[bool, str, Optional[dict]]:
         """
@@ -55,8 +82,33 @@ class AddressValidator:
         if not format_valid:
             return False, format_error, None
         
+        # An explicit non-NY state or non-NYC ZIP can be rejected without a geocoding round-trip
+        state_match = _STATE_TAIL_RE.search(address)
+        if state_match and state_match.group(1) != 'NY':
+            return False, "Address is outside New York State", None
+        
+        zip_match = _ZIP_TAIL_RE.search(address)
+        if zip_match and not _NYC_ZIP_RE.fullmatch(zip_match.group(1)):
+            return False, "ZIP code is outside New York City", None
+        
+        # Normalize so reruns with cosmetic differences hit the geocode cache
+        return self._validate_normalized_address(
+            InputSanitizer.sanitize_address(address).lower()
+        )
+    
+    def _validate_normalized_address(self, address: str) -> Tuple[bool, str, Optional[dict]]:
+        """
+        Geocode and bounds-check an already format-validated, normalized address
+        
+        Args:
+            address: Sanitized, lower-cased address
+            
+        Returns:
+            Tuple of (is_valid, message, geocode_result)
+        """
         # Check if address exists and is in NYC
         try:
+            # PlacesAPI.geocode_address is the single cached layer
             geocode_result = self.places_api.geocode_address(address)
             
             if not geocode_result:
@@ -100,20 +152,28 @@ class AddressValidator:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        # Validate start address
-        start_valid, start_message, _ = self.validate_nyc_address(start_address)
+        # Check if addresses are the same (before any network call)
+        if start_address.strip().lower() == end_address.strip().lower():
+            return False, "Start and end addresses cannot be the same"
+        
+        # Validate both addresses concurrently; the workers share this script run's
+        # context so cached geocoding and its st.warning/st.error calls still work
+        with ThreadPoolExecutor(
+            max_workers=2,
+            initializer=add_script_run_ctx,
+            initargs=(None, get_script_run_ctx())
+        ) as executor:
+            start_future = executor.submit(self.validate_nyc_address, start_address)
+            end_future = executor.submit(self.validate_nyc_address, end_address)
+            start_valid, start_message, _ = start_future.result()
+            end_valid, end_message, _ = end_future.result()
+        
         if not start_valid:
             return False, f"Start address error: {start_message}"
         
-        # Validate end address
-        end_valid, end_message, _ = self.validate_nyc_address(end_address)
         if not end_valid:
             return False, f"End address error: {end_message}"
         
-        # Check if addresses are the same
-        if start_address.strip().lower() == end_address.strip().lower():
-            return False, "Start and end addresses cannot be the same"
-        
         return True, "Both addresses are valid"
 
 class InputSanitizer:
@@ -133,17 +193,8 @@ class InputSanitizer:
         if not address:
             return ""
         
-        # Remove extra whitespace
-        address = re.sub(r'\s+', ' ', address.strip())
-        
-        # Remove potentially harmful characters
-        address = re.sub(r'[<>"\']', '', address)
-        
-        # Limit length
-        if len(address) > 200:
-            address = address[:200]
-        
-        return address
+        # Collapse whitespace, remove potentially harmful characters, limit length
+        return _BAD_RE.sub('', _WS_RE.sub(' ', address.strip()))[:200]
     
     @staticmethod
     def sanitize_user_input(text: str) -> str:
@@ -160,11 +211,11 @@ class InputSanitizer:
             return ""
         
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
+        text = _WS_RE.sub(' ', text.strip())
         
         # Remove HTML tags and potentially harmful characters
-        text = re.sub(r'<[^>]*>', '', text)
-        text = re.sub(r'[<>"\']', '', text)
+        text = _HTML_RE.sub('', text)
+        text = _BAD_RE.sub('', text)
         
         return text
 
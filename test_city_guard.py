@@ -1,22 +1,25 @@
 import os
 import sys
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 # --- Import the necessary functions and constants from your utils file ---
-# This assumes your utils.py file contains get_city_guard_data_by_view
-# and the CITY_GUARD_VIEWS dictionary.
+# This assumes your utils.py file contains fetch_views_from_snowflake,
+# get_city_guard_data_by_view and the CITY_GUARD_VIEWS dictionary.
 try:
-    from utils import get_city_guard_data_by_view, CITY_GUARD_VIEWS
+    from utils import get_city_guard_data_by_view, fetch_views_from_snowflake, CITY_GUARD_VIEWS
 except ImportError:
     print("🚨 ERROR: Could not find 'utils.py'.")
-    print("Please ensure 'utils.py' is in the same directory and contains 'get_city_guard_data_by_view' and 'CITY_GUARD_VIEWS'.")
+    print("Please ensure 'utils.py' is in the same directory and contains 'fetch_views_from_snowflake', 'get_city_guard_data_by_view' and 'CITY_GUARD_VIEWS'.")
     sys.exit(1)
 
 
 def main():
     """
-    Tests the get_city_guard_data_by_view function for each known view.
+    Fetches every City Guard view with fetch_views_from_snowflake (one batched
+    round-trip), falling back to parallel get_city_guard_data_by_view calls if the
+    batch fails, and always checks get_city_guard_data_by_view on one view.
     """
     
     # Check if essential environment variables are set before starting
@@ -33,10 +36,38 @@ def main():
     
     all_tests_passed = True
     
+    # Fetch every view in one round-trip; fall back to one query per view if the batch fails
+    results = fetch_views_from_snowflake({key: CITY_GUARD_VIEWS[key] for key in view_keys_to_test})
+    
+    if results is None:
+        # Query each view in parallel, one connection per worker
+        with ThreadPoolExecutor(max_workers=min(8, len(view_keys_to_test))) as executor:
+            results = dict(zip(
+                view_keys_to_test,
+                executor.map(
+                    lambda key: get_city_guard_data_by_view(view_key=key, dedicated_connection=True),
+                    view_keys_to_test
+                )
+            ))
+    
+    else:
+        # The batch succeeded, so smoke-test the single-view function on one view as well
+        first_key = view_keys_to_test[0]
+        single_df = get_city_guard_data_by_view(view_key=first_key)
+        batch_df = results.get(first_key)
+        if single_df is None:
+            print(f"\n❌ FAILURE: get_city_guard_data_by_view('{first_key}') returned no result.")
+            all_tests_passed = False
+        elif batch_df is not None and single_df.shape[1] != batch_df.shape[1]:
+            print(f"\n❌ FAILURE: get_city_guard_data_by_view('{first_key}') columns differ from the batched fetch.")
+            all_tests_passed = False
+        else:
+            print(f"\n✅ SUCCESS: get_city_guard_data_by_view('{first_key}') returned {single_df.shape}.")
+    
+    # Report in view order once every query has finished
     for view_key in view_keys_to_test:
         
-        # Call the specific function for City Guard views
-        df = get_city_guard_data_by_view(view_key=view_key)
+        df = results.get(view_key)
         
         if df is not None and not df.empty:
             print(f"\n✅ SUCCESS: Retrieved data for '{view_key}'.")
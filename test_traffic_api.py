@@ -3,34 +3,46 @@
 Debug script to test 511NY Traffic API
 """
 
-import requests
+import asyncio
 import json
+import orjson
+import pandas as pd
+from src.utils.http import get_session
 
 API_KEY = "fd7bd4600ee94588be5a28d448666112"
 BASE_URL = "https://511ny.org/api/getevents"
 
-def test_api_call(event_type):
+async def test_api_call(event_type):
     """Test API call with specific event type"""
-    print(f"\n{'='*60}")
-    print(f"Testing API with event_type: '{event_type}'")
-    print(f"{'='*60}")
-    
     params = {
         "apiKey": API_KEY,
         "format": "json",
         "type": event_type
     }
     
+    # Run the blocking request in a worker thread so all event types are in flight
+    # at once; everything below prints as one uninterrupted block
+    try:
+        response = await asyncio.to_thread(get_session().get, BASE_URL, params=params, timeout=15)
+    except Exception as e:
+        response = e
+    
+    print(f"\n{'='*60}")
+    print(f"Testing API with event_type: '{event_type}'")
+    print(f"{'='*60}")
+    
     try:
-        print(f"Making request to: {BASE_URL}")
+        print(f"Made request to: {BASE_URL}")
         print(f"Parameters: {params}")
         
-        response = requests.get(BASE_URL, params=params, timeout=15)
+        if isinstance(response, Exception):
+            raise response
+        
         print(f"\nResponse Status Code: {response.status_code}")
         print(f"Response Headers: {dict(response.headers)}")
         
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"\n✅ API call successful!")
             print(f"Response type: {type(data).__name__}")
             
@@ -43,11 +55,12 @@ def test_api_call(event_type):
                     print(f"\n📋 Sample event (first one):")
                     print(json.dumps(events[0], indent=2))
                     
-                    # Show all available keys in the event
+                    # Flatten all events into one frame to show the available fields
+                    events_df = pd.json_normalize(events)
                     print(f"\n🔑 Available keys in event:")
-                    for key in events[0].keys():
-                        value = events[0][key]
-                        print(f"   - {key}: {type(value).__name__} = {str(value)[:50]}")
+                    print(events_df.dtypes.to_string())
+                    print(f"\n📋 First rows:")
+                    print(events_df.head(3).to_string())
                 else:
                     print("⚠️ No events in response")
             elif isinstance(data, dict):
@@ -74,18 +87,17 @@ def test_api_call(event_type):
         import traceback
         traceback.print_exc()
 
-def main():
+async def main():
     print("🚦 Testing 511NY Traffic API")
     print("="*60)
     
-    # Test different event types
+    # Test different event types concurrently
     event_types = ["event", "congestion", "construction", "incident"]
     
-    for event_type in event_types:
-        test_api_call(event_type)
+    await asyncio.gather(*(test_api_call(event_type) for event_type in event_types))
     
     print("\n" + "="*60)
     print("Testing complete!")
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
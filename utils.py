@@ -1,19 +1,75 @@
-import snowflake.connector
+from __future__ import annotations
+
+import numpy as np
 import pandas as pd
-from typing import Optional, Dict
+import pyarrow as pa
+from typing import TYPE_CHECKING, Optional, Dict
 import os
-from dotenv import load_dotenv
+import atexit
+import threading
+from functools import lru_cache, partial, wraps
+from concurrent.futures import ThreadPoolExecutor
+from cachetools import TTLCache
+from cachetools.keys import hashkey
 import requests
-import pandas as pd
-from datetime import datetime
 from config.settings import Config
+from src.utils.http import DEFAULT_TIMEOUT, get_forecast_json, get_json, get_session
 import json as json
+import orjson
 from google import genai
 from google.genai import types
 
-load_dotenv() 
+if TYPE_CHECKING:
+    # Annotations only; the connector itself is imported lazily where it is used
+    import snowflake.connector
+
+
+def _ttl_cached(maxsize: int, ttl: float, cache_if=lambda result: result is not None, key=hashkey):
+    """
+    Memoizes a fetcher for `ttl` seconds, keyed on its arguments (via `key`).
+    Failed fetches (None by default, see `cache_if`) are not cached so the next call retries.
+    """
+    def decorator(func):
+        cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        lock = threading.Lock()
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            cache_key = key(*args, **kwargs)
+            with lock:
+                result = cache.get(cache_key)
+            if result is not None:
+                return result
+
+            result = func(*args, **kwargs)
+            if cache_if(result):
+                with lock:
+                    cache[cache_key] = result
+            return result
+
+        return wrapper
+    return decorator
+
+def _coords_key(latitude: float, longitude: float):
+    """Cache key for location-based fetchers: coordinates rounded to ~100 m."""
+    return hashkey(round(latitude, 3), round(longitude, 3))
+
+
+_AIR_QUALITY_URL = "https://airquality.googleapis.com/v1/currentConditions:lookup"
+_AIR_QUALITY_HEADERS = {'Content-Type': 'application/json'}
+# Fixed payload fields; only the location varies per call
+_AIR_QUALITY_PAYLOAD = {
+    # Ensure all necessary computations are requested
+    "extraComputations": ["POLLUTANT_CONCENTRATION"],
+    "languageCode": "en"
+}
+
+# Air Quality pollutant codes reported by get_air_quality_data_nyc -> result keys
+_AQ_POLLUTANT_KEYS = {'pm25': 'pm25', 'pm10': 'pm10'}
 
 # Updated function to accept latitude and longitude
+# Current conditions are updated hourly, so keep them for 30 minutes
+@_ttl_cached(maxsize=128, ttl=1800, key=lambda latitude=40.7128, longitude=-74.0060: _coords_key(latitude, longitude))
 def get_air_quality_data_nyc(latitude: float = 40.7128, longitude: float = -74.0060):
     """
     Fetches current air quality data for a given location using the Google Cloud Air Quality API.
@@ -34,29 +90,26 @@ def get_air_quality_data_nyc(latitude: float = 40.7128, longitude: float = -74.0
         print(f"Error accessing API Key: {e}")
         return None
 
-    url = "https://airquality.googleapis.com/v1/currentConditions:lookup"
-    
     # Payload for the API request uses the provided coordinates
     payload = {
         "location": {
             "latitude": latitude,
             "longitude": longitude
         },
-        # Ensure all necessary computations are requested
-        "extraComputations": ["POLLUTANT_CONCENTRATION"], 
-        "languageCode": "en"
+        **_AIR_QUALITY_PAYLOAD
     }
     
-    # Request headers
-    headers = {
-        'Content-Type': 'application/json'
-    }
-
     try:
         # Make the POST request to the Google Air Quality API
-        response = requests.post(url, headers=headers, params={'key': api_key}, data=json.dumps(payload))
+        response = get_session().post(
+            _AIR_QUALITY_URL,
+            params={'key': api_key},
+            data=orjson.dumps(payload),
+            headers=_AIR_QUALITY_HEADERS,
+            timeout=DEFAULT_TIMEOUT
+        )
         response.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
-        data = response.json()
+        data = orjson.loads(response.content)
         
         # --- Parse the relevant data ---
         aqi_data = {}
@@ -71,23 +124,14 @@ def get_air_quality_data_nyc(latitude: float = 40.7128, longitude: float = -74.0
             # CORRECT EXTRACTION: The dominant pollutant is directly in the index data
             aqi_data['pollutant'] = current_aqi_data.get('dominantPollutant', 'N/A')
         
-        # 2. Extract PM2.5 and PM10 from 'pollutants'
-        aqi_data['pm25'] = 'N/A'
-        aqi_data['pm10'] = 'N/A'
-        
-        if 'pollutants' in data and data['pollutants']:
-             for pollutant in data['pollutants']:
-                 code = pollutant.get('code')
-                 # Safely extract concentration value
-                 concentration = pollutant.get('concentration', {}).get('value')
-                 units = pollutant.get('concentration', {}).get('units')
-                 
-                 formatted_value = f"{concentration} {units}" if concentration is not None else 'N/A'
-
-                 if code == 'pm25':
-                     aqi_data['pm25'] = formatted_value
-                 elif code == 'pm10':
-                     aqi_data['pm10'] = formatted_value
+        # 2. Extract PM2.5 and PM10 from 'pollutants' ('N/A' if missing)
+        # Index pollutants by code once, then look up the reported ones directly
+        by_code = {p['code']: p for p in data.get('pollutants') or () if 'code' in p}
+        for code, key in _AQ_POLLUTANT_KEYS.items():
+            # Safely extract concentration value
+            concentration = by_code.get(code, {}).get('concentration') or {}
+            value = concentration.get('value')
+            aqi_data[key] = f"{value} {concentration.get('units', '')}" if value is not None else 'N/A'
 
         # Return the comprehensive dictionary
         if aqi_data.get('aqi') is not None:
@@ -103,6 +147,50 @@ def get_air_quality_data_nyc(latitude: float = 40.7128, longitude: float = -74.0
         print(f"An unexpected error occurred: {e}")
         return None
     
+def _to_float(value, default: float = 0.0) -> float:
+    """Converts an API reading to float, falling back to default if missing or unparseable."""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return default
+
+
+# Status label by (rainy << 1) | windy; rain takes precedence over wind
+_WEATHER_STATUS_LABELS = np.array(["Clear", "Windy", "Rainy", "Rainy"])
+
+
+def classify_weather_status(precipitation, wind_speed):
+    """
+    Classifies readings as "Rainy" (> 0.5 mm precipitation), else "Windy" (> 25 km/h wind),
+    else "Clear". Accepts scalars or equal-length arrays, so the same rule can label a
+    single current reading or a whole batch of hourly rows.
+    """
+    precipitation = np.asarray(precipitation, dtype=float)
+    wind_speed = np.asarray(wind_speed, dtype=float)
+    # Branch-free: index the label table with the 2-bit mask (rainy << 1) | windy
+    mask = ((precipitation > 0.5).astype(np.intp) << 1) | (wind_speed > 25)
+    return _WEATHER_STATUS_LABELS[mask]
+
+
+_OPEN_METEO_URL = "https://api.open-meteo.com/v1/forecast"
+# Fixed request parameters; only the coordinates vary per call
+_OPEN_METEO_PARAMS = {
+    "current": "temperature_2m,relative_humidity_2m,precipitation,rain,snowfall,wind_speed_10m,weather_code",
+    "hourly": "temperature_2m,relative_humidity_2m,precipitation_probability",
+    "daily": "temperature_2m_max,temperature_2m_min,uv_index_max",
+    "timezone": "auto",
+    "temperature_unit": "celsius",
+    "wind_speed_unit": "kmh",
+    "precipitation_unit": "mm",
+    "forecast_days": 7
+}
+# A 7-day forecast for one location is ~100 KB; anything far beyond that is rejected
+_OPEN_METEO_MAX_BYTES = 5_000_000
+
+# Open-Meteo refreshes forecasts every 15 minutes. This in-memory cache holds the
+# finished result (DataFrames included), so reruns skip parsing and frame building;
+# get_forecast_json's disk cache only holds the raw payload, to survive restarts.
+@_ttl_cached(maxsize=16, ttl=900, key=lambda latitude=40.7143, longitude=-74.006: _coords_key(latitude, longitude))
 def get_weather_data_nyc(latitude: float = 40.7143, longitude: float = -74.006):
     """
     Fetches current, hourly, and daily weather forecast data for a given location
@@ -118,83 +206,68 @@ def get_weather_data_nyc(latitude: float = 40.7143, longitude: float = -74.006):
     """
 
     # API request parameters use the provided coordinates
-    url = "https://api.open-meteo.com/v1/forecast"
-    params = {
-        "latitude": latitude, 
-        "longitude": longitude, 
-        "current": "temperature_2m,relative_humidity_2m,precipitation,rain,snowfall,wind_speed_10m,weather_code",
-        "hourly": "temperature_2m,relative_humidity_2m,precipitation_probability",
-        "daily": "temperature_2m_max,temperature_2m_min,uv_index_max",
-        "timezone": "auto",
-        "temperature_unit": "celsius",
-        "wind_speed_unit": "kmh",
-        "precipitation_unit": "mm",
-        "forecast_days": 7
-    }
+    params = {"latitude": latitude, "longitude": longitude, **_OPEN_METEO_PARAMS}
 
     try:
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()  # Raise an exception for HTTP errors (4xx or 5xx)
-        data = response.json()
+        # Streamed with a size cap, or read from the on-disk forecast cache
+        data = get_forecast_json(
+            _OPEN_METEO_URL,
+            params,
+            _OPEN_METEO_MAX_BYTES,
+            timeout=10,
+            # Same ~100 m rounding as the in-memory cache key (_coords_key)
+            cache_key=f"open-meteo:{round(latitude, 3)},{round(longitude, 3)}"
+        )
 
         # --- Current Data Structuring ---
         current = data.get('current', {})
         
-        # Simple weather status based on precipitation or wind
-        status = "Clear"
+        # Parse the numeric readings once (0 if missing or unparseable)
+        precipitation_value = _to_float(current.get('precipitation'))
+        wind_value = _to_float(current.get('wind_speed_10m'))
         
-        raw_precipitation = current.get('precipitation', 0)
-        raw_wind_value = current.get('wind_speed_10m', 0)
+        # Simple weather status based on precipitation or wind
+        status = str(classify_weather_status(precipitation_value, wind_value))
         
-        try:
-            wind_value = float(raw_wind_value)
-        except (ValueError, TypeError):
-            wind_value = 0.0 # Default to 0 if wind value is unparseable
-
-        if raw_precipitation > 0.5: # 0.5mm threshold for "Rainy"
-             status = "Rainy"
-        elif wind_value > 25:
-             status = "Windy"
+        # ISO 'YYYY-MM-DDTHH:MM' has fixed offsets, so the HH:MM part is a plain slice
+        raw_time = current.get('time', '2025-10-15T17:45')
         
         current_data = {
-            'time': current.get('time', '2025-10-15T17:45').split('T')[1][:5], 
-            'date_time_raw': current.get('time', '2025-10-15T17:45'),
+            'time': raw_time[11:16], 
+            'date_time_raw': raw_time,
             'temp': f"{current.get('temperature_2m', 'N/A')}",
             'humidity': f"{current.get('relative_humidity_2m', 'N/A')}",
             'wind': f"{current.get('wind_speed_10m', 'N/A')} {data['current_units'].get('wind_speed_10m', '')}",
+            'wind_value': wind_value,
+            'precipitation_value': precipitation_value,
             'status': status
         }
         
         # --- Hourly Data Structuring (FIXED) ---
         hourly_raw = data.get('hourly', {})
-        hourly_df_raw = pd.DataFrame({
-            "Time": [t.split('T')[1].split(':')[0] for t in hourly_raw.get('time', [])],
-            "Date": [t.split('T')[0] for t in hourly_raw.get('time', [])],
-            "Temperature": hourly_raw.get('temperature_2m', []),
-            "Humidity": hourly_raw.get('relative_humidity_2m', []),
-            "Precip. Prob.": hourly_raw.get('precipitation_probability', []),
-        })
         
         # Filter for current hour and next 24 hours
         try:
-            # Use the full time string from the hourly data for filtering precision
-            hourly_df_raw['datetime'] = pd.to_datetime(hourly_df_raw['Date'] + 'T' + hourly_df_raw['Time'] + ':00')
-            current_time = datetime.strptime(current_data['date_time_raw'], "%Y-%m-%dT%H:%M")
-            
-            # Find the index of the first hour that is equal to or after the current time
-            start_index = hourly_df_raw[hourly_df_raw['datetime'] >= current_time].index.min()
+            # Parse all hourly timestamps in one vectorized pass (ISO minutes, ascending)
+            hourly_times = np.array(hourly_raw.get('time', []), dtype='datetime64[m]')
             
-            if pd.isna(start_index):
-                start_index = 0
-
-            # Filter for 24 hours starting from the current hour/next hour
-            filtered_hourly_df = hourly_df_raw.iloc[start_index:start_index + 24].copy()
+            # Truncate the current time to the hour so the current hour is included
+            current_hour = np.datetime64(current_data['date_time_raw'], 'm').astype('datetime64[h]')
             
-            # Rename the 'Time' column to HH:00 format for cleaner chart labels
-            filtered_hourly_df['Time'] = filtered_hourly_df['datetime'].dt.strftime('%H:00')
+            # 24 hours starting from the current hour: binary-search the start, fall back to the first 24
+            start = int(np.searchsorted(hourly_times, current_hour, side='left'))
+            if start >= len(hourly_times):
+                start = 0
+            window = slice(start, start + 24)
             
+            # Build only the 24-row frame; 'Time' uses HH:00 format for cleaner chart labels
             # --- CRITICAL FIX: DO NOT SET INDEX HERE ---
-            final_hourly_df = filtered_hourly_df[['Time', 'Temperature', 'Humidity', 'Precip. Prob.']]
+            final_hourly_df = pd.DataFrame({
+                'Time': pd.DatetimeIndex(hourly_times[window]).strftime('%H:00'),
+                'Temperature': hourly_raw.get('temperature_2m', [])[window],
+                'Humidity': hourly_raw.get('relative_humidity_2m', [])[window],
+                'Precip. Prob.': hourly_raw.get('precipitation_probability', [])[window],
+            })
 
         except Exception as e:
             print(f"Error processing hourly data: {e}")
@@ -203,19 +276,20 @@ def get_weather_data_nyc(latitude: float = 40.7143, longitude: float = -74.006):
         # --- Daily Data Structuring ---
         daily_raw = data.get('daily', {})
         daily_df = pd.DataFrame({
-            "Date": daily_raw.get('time', []),
-            "Max Temp": [f"{t}{data['daily_units'].get('temperature_2m_max', '')}" for t in daily_raw.get('temperature_2m_max', [])],
-            "Min Temp": [f"{t}{data['daily_units'].get('temperature_2m_min', '')}" for t in daily_raw.get('temperature_2m_min', '')],
+            "Date": pd.to_datetime(pd.Series(daily_raw.get('time', []), dtype=str), format="%Y-%m-%d").dt.strftime("%a, %b %d"),
+            "Max Temp": pd.to_numeric(pd.Series(daily_raw.get('temperature_2m_max', []), dtype=object), errors='coerce'),
+            "Min Temp": pd.to_numeric(pd.Series(daily_raw.get('temperature_2m_min', []), dtype=object), errors='coerce'),
             "Max UV Index": daily_raw.get('uv_index_max', []),
         })
+        # Temperatures stay numeric; their units travel with the frame for display
+        daily_df.attrs['units'] = {
+            'Max Temp': data.get('daily_units', {}).get('temperature_2m_max', ''),
+            'Min Temp': data.get('daily_units', {}).get('temperature_2m_min', ''),
+        }
         
         if not daily_df.empty:
             # Rename the first entry to 'Today'
             daily_df.loc[0, 'Date'] = 'Today'
-            # Format the remaining dates
-            daily_df['Date'] = daily_df['Date'].apply(
-                lambda x: datetime.strptime(x, "%Y-%m-%d").strftime("%a, %b %d") if x != 'Today' and isinstance(x, str) else x
-            )
         
         # --- Final Return ---
         return {
@@ -231,6 +305,12 @@ def get_weather_data_nyc(latitude: float = 40.7143, longitude: float = -74.006):
         print(f"An unexpected error occurred during weather data processing: {e}")
         return None # Returns None on any other processing error
     
+_NEWS_API_URL = "https://newsapi.org/v2/everything"
+_NEWS_ERROR_PREFIX = "Error fetching news"
+_NEWS_SEPARATOR = " \t • \t "
+
+# Headlines for a region are refreshed every 5 minutes; error messages are not cached
+@_ttl_cached(maxsize=64, ttl=300, cache_if=lambda result: not result.startswith(_NEWS_ERROR_PREFIX))
 def get_news_headlines(region: str) -> str:
     """
     Fetches top news headlines for the specified region using NewsAPI.
@@ -244,32 +324,91 @@ def get_news_headlines(region: str) -> str:
     # Get API key from config
     api_key = os.getenv('NEWS_API_KEY')
 
-    # Construct the query to be broad for NYC news, and specific to the region
-    search_query = f"New York City AND {region}"
-    url = f"https://newsapi.org/v2/everything?q={search_query}&sortBy=publishedAt&language=en&pageSize=100&apiKey={api_key}"
+    # Construct the query to be broad for NYC news, and specific to the region;
+    # passed as params so region names with spaces or '&'/'#' are percent-encoded
+    params = {
+        'q': f"New York City AND {region}",
+        'sortBy': 'publishedAt',
+        'language': 'en',
+        'pageSize': 100,
+        'apiKey': api_key
+    }
 
     try:
-        response = requests.get(url, timeout=5)
-        response.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
-        data = response.json()
+        # Conditional GET: an unchanged feed comes back as 304 and reuses the last body
+        data = get_json(_NEWS_API_URL, params=params, timeout=DEFAULT_TIMEOUT)
         
-        articles = data.get('articles', [])
+        # Format headlines for the marquee in one pass over the articles (skipping those
+        # without a title), using a distinctive separator for the continuous scroll effect
+        headlines = _NEWS_SEPARATOR.join(
+            "📰 " + article['title'] for article in data.get('articles', ()) if article.get('title')
+        )
         
-        if not articles:
+        if not headlines:
             return f"No recent headlines found for {region}."
 
-        # Format headlines for the marquee
-        headlines = [f"📰 {article['title']}" for article in articles]
-        
-        # Use a distinctive separator for the continuous scroll effect
-        return " \t • \t ".join(headlines) + " \t • \t "
+        return headlines + _NEWS_SEPARATOR
         
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
         print(f"Error fetching news data: {e}")
-        return f"Error fetching news for {region}: API request failed."
+        return f"{_NEWS_ERROR_PREFIX} for {region}: API request failed."
+
+
+def prefetch_dashboard(region: str, latitude: float, longitude: float) -> Dict[str, object]:
+    """
+    Fetches everything the Home dashboard needs for a region in one concurrent burst,
+    so page load waits for the slowest API rather than the sum of all of them.
+
+    Args:
+        region: The NYC subregion used for the news query.
+        latitude (float): Latitude for the weather and air quality lookups.
+        longitude (float): Longitude for the weather and air quality lookups.
+
+    Returns:
+        Dict with 'weather', 'air_quality' and 'news' entries holding each fetcher's
+        normal return value, or None if that fetcher raised.
+    """
+    fetchers = {
+        'weather': partial(get_weather_data_nyc, latitude=latitude, longitude=longitude),
+        'air_quality': partial(get_air_quality_data_nyc, latitude=latitude, longitude=longitude),
+        'news': partial(get_news_headlines, region=region),
+    }
+
+    # A pool per call: a shared module-level pool would be shared by every Streamlit
+    # session, queueing concurrent page loads behind the same few workers
+    results = {}
+    with ThreadPoolExecutor(max_workers=len(fetchers), thread_name_prefix='dashboard') as executor:
+        futures = {name: executor.submit(fetch) for name, fetch in fetchers.items()}
+
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                print(f"Error prefetching {name} data: {e}")
+                results[name] = None
+    return results
     
 
 
+@lru_cache(maxsize=1)
+def _default_conn_params() -> Dict[str, str]:
+    """
+    Connection defaults from the environment (.env is loaded by config.settings),
+    resolved once. Call _default_conn_params.cache_clear() after changing the environment.
+    """
+    return {
+        param: os.environ[env_var]
+        for param, env_var in {
+            'user': 'SNOWFLAKE_USER',
+            'password': 'SNOWFLAKE_PASSWORD',
+            'account': 'SNOWFLAKE_ACCOUNT',
+            'warehouse': 'SNOWFLAKE_WAREHOUSE',
+            'database': 'SNOWFLAKE_DATABASE',
+        }.items()
+        if os.environ.get(env_var)
+    }
+
+
 def _create_snowflake_connection(
     conn_params: Optional[Dict[str, str]] = None,
     user: Optional[str] = None,
@@ -283,26 +422,27 @@ def _create_snowflake_connection(
     Prepares connection parameters and establishes a connection to Snowflake.
     Prioritizes explicit arguments, then falls back to environment variables.
     """
+    # Imported lazily: the connector is slow to import and only the Snowflake paths need it
+    import snowflake.connector
     
     # 1. Prepare Connection Parameters
     if conn_params is None:
-        # Fetch individual parameters, prioritizing arguments over environment variables
-        user = user or os.environ.get("SNOWFLAKE_USER")
-        password = password or os.environ.get("SNOWFLAKE_PASSWORD")
-        account = account or os.environ.get("SNOWFLAKE_ACCOUNT")
-        warehouse = warehouse or os.environ.get("SNOWFLAKE_WAREHOUSE")
-        database = database or os.environ.get("SNOWFLAKE_DATABASE")
-
-        conn_params = {
+        # Explicit arguments override the cached environment defaults
+        explicit_params = {
             'user': user,
             'password': password,
             'account': account,
             'warehouse': warehouse,
             'database': database,
         }
+        conn_params = {**_default_conn_params(), **{k: v for k, v in explicit_params.items() if v}}
         
     # Filter out None values for the connection call (important)
     conn_params = {k: v for k, v in conn_params.items() if v is not None}
+    # Results are fetched as Arrow (see _arrow_to_pandas)
+    conn_params.setdefault('session_parameters', {'PYTHON_CONNECTOR_QUERY_RESULT_FORMAT': 'ARROW'})
+    # Connections are cached (see _get_conn), so keep the session alive between queries
+    conn_params.setdefault('client_session_keep_alive', True)
 
     # Critical check for required parameters
     required_params = ['user', 'password', 'account']
@@ -320,6 +460,119 @@ def _create_snowflake_connection(
         return None
 
 
+# Open Snowflake connections, one per distinct set of connection arguments
+_SNOWFLAKE_CONNS: Dict[tuple, snowflake.connector.SnowflakeConnection] = {}
+_SNOWFLAKE_LOCK = threading.Lock()
+
+
+def close_snowflake() -> None:
+    """Closes every pooled Snowflake connection (also registered with atexit)."""
+    with _SNOWFLAKE_LOCK:
+        for conn in _SNOWFLAKE_CONNS.values():
+            try:
+                conn.close()
+            except Exception:
+                pass
+        _SNOWFLAKE_CONNS.clear()
+
+atexit.register(close_snowflake)
+
+
+def _get_conn(
+    conn_params: Optional[Dict[str, str]] = None,
+    user: Optional[str] = None,
+    password: Optional[str] = None,
+    account: Optional[str] = None,
+    warehouse: Optional[str] = None,
+    database: Optional[str] = None,
+    schema: Optional[str] = None
+) -> Optional[snowflake.connector.SnowflakeConnection]:
+    """
+    Returns a reusable Snowflake connection for the given parameters so repeated
+    queries pay the TLS + auth + session setup only once. A cached connection is
+    re-created if the client reports it closed; no server round trip is spent on
+    checking it, since client_session_keep_alive keeps the session from expiring.
+    """
+    key = (
+        tuple(sorted(conn_params.items())) if conn_params else None,
+        user, password, account, warehouse, database, schema
+    )
+
+    with _SNOWFLAKE_LOCK:
+        conn = _SNOWFLAKE_CONNS.get(key)
+        if conn is not None:
+            # is_closed() is a local check, so reuse costs nothing
+            if not conn.is_closed():
+                return conn
+            print("Cached Snowflake connection is closed, reconnecting.")
+            _SNOWFLAKE_CONNS.pop(key, None)
+
+        conn = _create_snowflake_connection(
+            conn_params=conn_params,
+            user=user,
+            password=password,
+            account=account,
+            warehouse=warehouse,
+            database=database,
+            schema=schema
+        )
+        if conn is not None:
+            _SNOWFLAKE_CONNS[key] = conn
+        return conn
+
+
+# Strings become pyarrow-backed and booleans nullable, instead of NumPy object
+# columns; other types keep their usual NumPy dtypes
+_ARROW_DTYPES = {
+    pa.string(): pd.StringDtype("pyarrow"),
+    pa.large_string(): pd.StringDtype("pyarrow"),
+    pa.bool_(): pd.BooleanDtype(),
+}
+
+# The same dtypes by Snowflake column type, for result sets with no rows
+_SNOWFLAKE_EMPTY_DTYPES = {
+    'REAL': 'float64',
+    'TEXT': pd.StringDtype("pyarrow"),
+    'BOOLEAN': pd.BooleanDtype(),
+    'TIMESTAMP_NTZ': 'datetime64[ns]',
+}
+
+
+def _empty_frame(description) -> pd.DataFrame:
+    """Builds an empty DataFrame whose column dtypes follow the cursor's result metadata."""
+    from snowflake.connector.constants import FIELD_ID_TO_NAME
+
+    columns = {}
+    for col in description:
+        type_name = FIELD_ID_TO_NAME.get(col.type_code)
+        if type_name == 'FIXED':
+            dtype = 'int64' if not col.scale else 'float64'
+        else:
+            dtype = _SNOWFLAKE_EMPTY_DTYPES.get(type_name, 'object')
+        columns[col.name] = pd.Series(dtype=dtype)
+    return pd.DataFrame(columns)
+
+
+def _arrow_to_pandas(tbl: pa.Table, arrow_dtypes: bool = False) -> pd.DataFrame:
+    """
+    Converts an Arrow result table to a DataFrame with explicit string/boolean dtypes.
+    Decimal columns are cast to float64 first, matching fetch_pandas_all().
+    With arrow_dtypes=True every column is kept Arrow-backed (pd.ArrowDtype) instead.
+    """
+    if arrow_dtypes:
+        return tbl.to_pandas(types_mapper=pd.ArrowDtype, split_blocks=True, self_destruct=True)
+
+    for i, field in enumerate(tbl.schema):
+        if pa.types.is_decimal(field.type):
+            tbl = tbl.set_column(i, field.name, tbl.column(i).cast(pa.float64()))
+
+    return tbl.to_pandas(
+        types_mapper=_ARROW_DTYPES.get,
+        split_blocks=True,
+        self_destruct=True
+    )
+
+
 def fetch_data_from_snowflake(
     query: str,
     conn_params: Optional[Dict[str, str]] = None,
@@ -328,11 +581,13 @@ def fetch_data_from_snowflake(
     account: Optional[str] = None,
     warehouse: Optional[str] = None,
     database: Optional[str] = None,
-    schema: Optional[str] = None
+    schema: Optional[str] = None,
+    use_arrow_dtypes: bool = False,
+    dedicated_connection: bool = False
 ) -> Optional[pd.DataFrame]:
     """
-    Establishes a connection, executes a query, fetches the results into a Pandas DataFrame,
-    and ensures the connection is closed.
+    Executes a query on a shared Snowflake connection and fetches the results into a
+    Pandas DataFrame. The connection stays open for later queries and is closed at exit.
 
     Args:
         query (str): The SQL query to execute.
@@ -343,15 +598,22 @@ def fetch_data_from_snowflake(
         warehouse (Optional[str]): Snowflake warehouse to use (defaults to SNOWFLAKE_WAREHOUSE env var).
         database (Optional[str]): Snowflake database to use (defaults to SNOWFLAKE_DATABASE env var).
         schema (Optional[str]): Snowflake schema to use (defaults to SNOWFLAKE_SCHEMA env var).
+        use_arrow_dtypes (bool): Keep every column Arrow-backed (pd.ArrowDtype), zero-copy
+                                 where possible. Defaults to NumPy dtypes with
+                                 pyarrow-backed strings.
+        dedicated_connection (bool): Run on a new connection that is closed afterwards,
+                                     instead of the shared one (whose queries run one at
+                                     a time), e.g. for queries issued from several threads.
 
     Returns:
         Optional[pd.DataFrame]: A Pandas DataFrame containing the query results, 
                                 or None if an error occurred.
     """
-    conn = None
-    
-    # 1. & 2. Create Connection using the helper function
-    conn = _create_snowflake_connection(
+    import snowflake.connector
+
+    # 1. & 2. Reuse (or lazily create) the connection for these parameters,
+    # or open a private one
+    conn = (_create_snowflake_connection if dedicated_connection else _get_conn)(
         conn_params=conn_params,
         user=user,
         password=password,
@@ -364,16 +626,20 @@ def fetch_data_from_snowflake(
     if conn is None:
         return None
 
+    cursor = None
     try:
         # 3. Execute Query and Fetch Data into DataFrame
         print(f"Executing query: {query[:50]}...")
         cursor = conn.cursor()
         cursor.execute(query)
         
-        # Fetch results directly into a Pandas DataFrame
-        df = cursor.fetch_pandas_all()
+        # Fetch the Arrow result and convert it in place (releasing Arrow buffers as it goes)
+        tbl = cursor.fetch_arrow_all()
+        if tbl is not None:
+            df = _arrow_to_pandas(tbl, arrow_dtypes=use_arrow_dtypes)
+        else:
+            df = _empty_frame(cursor.description)
         
-        cursor.close()
         print("Query executed successfully and data fetched.")
         return df
 
@@ -383,12 +649,82 @@ def fetch_data_from_snowflake(
     except Exception as e:
         print(f"An unexpected error occurred during query execution: {e}")
         return None
-
     finally:
-        # 4. Ensure Connection Closure
-        if conn:
+        # A pooled connection stays open; only the cursor is released
+        if cursor is not None:
+            cursor.close()
+        if dedicated_connection:
             conn.close()
-            print("Snowflake connection closed.")
+
+
+def fetch_views_from_snowflake(
+    views: Dict[str, str],
+    conn_params: Optional[Dict[str, str]] = None,
+    user: Optional[str] = None,
+    password: Optional[str] = None,
+    account: Optional[str] = None,
+    warehouse: Optional[str] = None,
+    database: Optional[str] = None,
+    schema: Optional[str] = None
+) -> Optional[Dict[str, pd.DataFrame]]:
+    """
+    Fetches several views in a single round-trip by submitting one multi-statement
+    request (one SELECT per view) and reading each result set in turn.
+
+    Args:
+        views (Dict[str, str]): Mapping of view key to fully qualified view name.
+        Remaining arguments are the same as for fetch_data_from_snowflake.
+
+    Returns:
+        Optional[Dict[str, pd.DataFrame]]: One DataFrame per view key, or None if the
+                                           batch failed (callers can then fall back to
+                                           fetching views one by one).
+    """
+    import snowflake.connector
+
+    if not views:
+        return {}
+
+    conn = _get_conn(
+        conn_params=conn_params,
+        user=user,
+        password=password,
+        account=account,
+        warehouse=warehouse,
+        database=database,
+        schema=schema
+    )
+
+    if conn is None:
+        return None
+
+    cursor = None
+    try:
+        query = " ".join(f"SELECT * FROM {view_name};" for view_name in views.values())
+        print(f"Executing batched query for {len(views)} views...")
+        cursor = conn.cursor()
+        cursor.execute(query, num_statements=len(views))
+
+        # Result sets come back in statement order
+        results = {}
+        for i, view_key in enumerate(views):
+            if i:
+                cursor.nextset()
+            tbl = cursor.fetch_arrow_all()
+            results[view_key] = _arrow_to_pandas(tbl) if tbl is not None else _empty_frame(cursor.description)
+
+        print("Batched query executed successfully and data fetched.")
+        return results
+
+    except snowflake.connector.errors.ProgrammingError as e:
+        print(f"Snowflake Programming Error: {e.errno}: {e.msg}")
+        return None
+    except Exception as e:
+        print(f"An unexpected error occurred during batched query execution: {e}")
+        return None
+    finally:
+        if cursor is not None:
+            cursor.close()
 
 BINSYNC_VIEWS: Dict[str, str] = {
     "WASTE_TONNAGE": "DEV_PREMIER_LEAGUE.BIN_SYNC_SERVICE.VW_MONTHLY_WASTE_TONNAGE_BY_BOROUGH",
@@ -440,7 +776,7 @@ def get_binsync_data_by_view(
 
 def calculate_monthly_waste_metrics(connection_params: Optional[Dict] = None) -> Optional[pd.DataFrame]:
     """
-    Fetches the raw recycling diversion data and aggregates it to provide
+    Aggregates the recycling diversion data in Snowflake to provide
     the total waste, total recycled waste, and the true overall diversion 
     rate on a monthly basis across all boroughs.
 
@@ -451,45 +787,29 @@ def calculate_monthly_waste_metrics(connection_params: Optional[Dict] = None) ->
         Optional[pd.DataFrame]: A DataFrame with the aggregated monthly metrics.
     """
     
-    # 1. Fetch the raw monthly/borough data
-    df = get_binsync_data_by_view(
-        view_key='RECYCLING_DIVERSION_RATE',
-        conn_params=connection_params
-    )
-    
-    if df is None:
+    # The monthly DIVERSION RATE is calculated from the *total* tons, not by
+    # averaging the existing DIVERSION_RATE_PERCENTAGE column (which would
+    # incorrectly weight the smaller boroughs). Aggregating in Snowflake returns
+    # one row per month instead of one per borough and month; NULLIF makes a
+    # zero-waste month yield NULL rather than a division error.
+    query = f"""
+        SELECT
+            MONTH,
+            ROUND(SUM(TOTAL_WASTE_TONS), 2) AS TOTAL_WASTE_TONS_MONTHLY,
+            ROUND(SUM(TOTAL_RECYCLED_TONS), 2) AS TOTAL_RECYCLED_TONS_MONTHLY,
+            ROUND(100 * SUM(TOTAL_RECYCLED_TONS) / NULLIF(SUM(TOTAL_WASTE_TONS), 0), 2)
+                AS DIVERSION_RATE_AVG_MONTHLY
+        FROM {BINSYNC_VIEWS['RECYCLING_DIVERSION_RATE']}
+        GROUP BY MONTH
+        ORDER BY MONTH;
+    """
+
+    monthly_summary = fetch_data_from_snowflake(query=query, conn_params=connection_params)
+
+    if monthly_summary is None:
         print("Aggregation failed: Could not retrieve data for 'RECYCLING_DIVERSION_RATE'.")
         return None
     
-    # 2. Perform the aggregation by 'MONTH'
-    # We sum the tons to get the total amounts across all boroughs for the month.
-    # The monthly average DIVERSION RATE is calculated from the *total* tons, 
-    # not by averaging the existing DIVERSION_RATE_PERCENTAGE column (which 
-    # would incorrectly weight the smaller boroughs).
-    
-    monthly_summary = df.groupby('MONTH').agg(
-        # Aggregate 1: Total waste collected monthly
-        TOTAL_WASTE_TONS_MONTHLY=('TOTAL_WASTE_TONS', 'sum'),
-        
-        # Aggregate 2: Total recycled waste monthly
-        TOTAL_RECYCLED_TONS_MONTHLY=('TOTAL_RECYCLED_TONS', 'sum')
-    ).reset_index()
-
-    # Aggregate 3: Calculate the TRUE overall diversion rate for the month
-    # Formula: (Total Recycled TONS / Total Waste TONS) * 100
-    monthly_summary['DIVERSION_RATE_AVG_MONTHLY'] = (
-        monthly_summary['TOTAL_RECYCLED_TONS_MONTHLY'] / 
-        monthly_summary['TOTAL_WASTE_TONS_MONTHLY']
-    ) * 100
-    
-    # 3. Round the aggregated metrics to 2 decimal places
-    columns_to_round = [
-        'TOTAL_WASTE_TONS_MONTHLY', 
-        'TOTAL_RECYCLED_TONS_MONTHLY', 
-        'DIVERSION_RATE_AVG_MONTHLY'
-    ]
-    monthly_summary[columns_to_round] = monthly_summary[columns_to_round].round(2)
-    
     print("\n✅ SUCCESS: Calculated aggregated monthly metrics.")
     
     return monthly_summary
@@ -543,14 +863,12 @@ def get_bin_locations_data(connection_params: Optional[Dict] = None) -> Optional
         df['Type'] = 'Waste Bin'
 
     # 5. Remove invalid or garbage coordinates
-    # Drop rows where lat/lon are missing, null, or not numbers
-    df = df[pd.to_numeric(df['lat'], errors='coerce').notna()]
-    df = df[pd.to_numeric(df['lon'], errors='coerce').notna()]
-    df['lat'] = df['lat'].astype(float)
-    df['lon'] = df['lon'].astype(float)
-
-    # Filter out out-of-range coordinates (not on Earth)
-    df = df[(df['lat'].between(-90, 90)) & (df['lon'].between(-180, 180))]
+    # Parse each coordinate column once; missing or non-numeric values become NaN,
+    # which fails the range check below along with out-of-range (not on Earth) values
+    lat = pd.to_numeric(df['lat'], errors='coerce')
+    lon = pd.to_numeric(df['lon'], errors='coerce')
+    mask = lat.between(-90, 90) & lon.between(-180, 180)
+    df = df.assign(lat=lat.astype(float), lon=lon.astype(float)).loc[mask]
 
     # 6. Drop duplicates, reset index
     df = df.drop_duplicates(subset=['lat', 'lon', 'Name']).reset_index(drop=True)
@@ -581,10 +899,12 @@ def get_city_guard_data_by_view(
     account: Optional[str] = None,
     warehouse: Optional[str] = None,
     database: Optional[str] = None,
-    schema: Optional[str] = None
+    schema: Optional[str] = None,
+    dedicated_connection: bool = False
 ) -> Optional[pd.DataFrame]:
     """
     Fetches data from a specified City Guard view in Snowflake.
+    See fetch_data_from_snowflake for dedicated_connection.
     """
     view_key = view_key.upper()
     view_name = CITY_GUARD_VIEWS.get(view_key)
@@ -607,7 +927,8 @@ def get_city_guard_data_by_view(
         account=account,
         warehouse=warehouse,
         database=database,
-        schema=schema
+        schema=schema,
+        dedicated_connection=dedicated_connection
     )
     
     return df
@@ -620,10 +941,7 @@ async def get_nyc_demographics() -> Optional[Dict[str, str]]:
     This function now aggregates the streamed chunks into a single
     JSON string and then processes it.
     """
-    # 1. Load environment variables
-    load_dotenv()
-    
-    # 2. Craft the specific prompt
+    # 1. Craft the specific prompt (environment variables are loaded at import)
     prompt = """
     What is the latest estimated population and the latest reported birth rate for New York City?
     Provide ony numbers and nothing else.
@@ -636,8 +954,8 @@ async def get_nyc_demographics() -> Optional[Dict[str, str]]:
     }
     """
     
-    # 3. Call the streaming function and aggregate the response
-    full_response = ""
+    # 2. Call the streaming function and aggregate the response
+    response_chunks = []
     print("Calling Gemini 2.5 Flash to fetch NYC demographics (via stream)...")
     
     try:
@@ -649,11 +967,12 @@ async def get_nyc_demographics() -> Optional[Dict[str, str]]:
             if chunk.startswith("Error:"):
                 print(f"🚨 {chunk}")
                 return None
-            full_response += chunk
+            response_chunks.append(chunk)
         
+        full_response = "".join(response_chunks)
         print(full_response)
         print("++++++++++++++++++++ ")
-        # 4. Clean and parse the aggregated JSON response
+        # 3. Clean and parse the aggregated JSON response
         response_text = full_response.strip().replace("```json", "").replace("```", "").strip()
         
         if not response_text:
@@ -662,7 +981,7 @@ async def get_nyc_demographics() -> Optional[Dict[str, str]]:
             
         data = json.loads(response_text)
         
-        # 5. Perform specific validation
+        # 4. Perform specific validation
         if data and isinstance(data, dict) and "population" in data and "birth_rate" in data:
             print("✅ Successfully fetched, aggregated, and parsed data.")
             return data